@@ -9,6 +9,11 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    BOOKING_HOLD_EXPIRE_MINUTES: int = 10
+    BOOKING_HOLD_REAP_INTERVAL_SECONDS: int = 30
+    BOOKING_HOLD_MAX_PER_CLIENT: int = 2
+    BOOKING_HOLD_MAX_PER_ROOM: int = 3
+    QUERY_BUDGET_STRICT: bool = False
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,91 @@
+import heapq
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+
+class HeldRange(NamedTuple):
+    token: str
+    room_id: int
+    check_in_date: date
+    check_out_date: date
+    expires_at: datetime
+
+    @classmethod
+    def from_hold(cls, hold) -> 'HeldRange':
+        expires_at = hold.expires_at
+        if expires_at.tzinfo is None:
+            # SQLite hands back naive datetimes; stored values are UTC.
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return cls(hold.token, hold.room_id, hold.check_in_date, hold.check_out_date, expires_at)
+
+
+class HoldStore:
+    """In-process index of active booking holds.
+
+    Holds are kept in a min-heap ordered by expiry so expired entries can be
+    dropped without scanning, and in a per-room index for overlap checks.
+    The booking_holds table stays the source of truth: a hit here only lets
+    booking and hold creation return 409 before taking the room lock.
+
+    The store assumes a single worker (see start.sh). Changes made by other
+    processes or directly in the database show up after the next replace()
+    from the reaper, so a stale hit lasts at most one reap interval.
+    """
+
+    def __init__(self) -> None:
+        self._holds: Dict[str, HeldRange] = {}
+        self._by_room: Dict[int, Set[str]] = {}
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+
+    def add(self, hold: HeldRange) -> None:
+        self.discard(hold.token)
+        self._holds[hold.token] = hold
+        self._by_room.setdefault(hold.room_id, set()).add(hold.token)
+        heapq.heappush(self._expiry_heap, (hold.expires_at, hold.token))
+
+    def discard(self, token: str) -> Optional[HeldRange]:
+        # Heap entries are dropped lazily in pop_expired.
+        hold = self._holds.pop(token, None)
+        if hold is not None:
+            room_tokens = self._by_room.get(hold.room_id)
+            if room_tokens is not None:
+                room_tokens.discard(token)
+                if not room_tokens:
+                    del self._by_room[hold.room_id]
+        return hold
+
+    def overlaps(self, room_id: int, check_in: date, check_out: date, now: Optional[datetime] = None) -> bool:
+        now = now or datetime.now(timezone.utc)
+        self.pop_expired(now)
+        for token in self._by_room.get(room_id, ()):
+            hold = self._holds[token]
+            if hold.check_in_date < check_out and hold.check_out_date > check_in:
+                return True
+        return False
+
+    def pop_expired(self, now: Optional[datetime] = None) -> List[HeldRange]:
+        now = now or datetime.now(timezone.utc)
+        expired = []
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, token = heapq.heappop(self._expiry_heap)
+            hold = self._holds.get(token)
+            # Skip stale heap entries left behind by discard() or a re-add.
+            if hold is not None and hold.expires_at == expires_at:
+                expired.append(self.discard(token))
+        return expired
+
+    def replace(self, holds: Iterable[HeldRange]) -> None:
+        self.clear()
+        for hold in holds:
+            self.add(hold)
+
+    def clear(self) -> None:
+        self._holds.clear()
+        self._by_room.clear()
+        self._expiry_heap.clear()
+
+    def __len__(self) -> int:
+        return len(self._holds)
+
+
+hold_store = HoldStore()
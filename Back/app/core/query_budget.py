@@ -0,0 +1,121 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, List, NamedTuple, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudget(NamedTuple):
+    statements: int
+    rows: Optional[int] = None
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryStats:
+    def __init__(self) -> None:
+        self.statements: List[str] = []
+        self.rows = 0
+
+    @property
+    def statement_count(self) -> int:
+        return len(self.statements)
+
+    def violations(self, budget: QueryBudget) -> List[str]:
+        problems = []
+        if self.statement_count > budget.statements:
+            problems.append(f"{self.statement_count} statements (budget {budget.statements})")
+        if budget.rows is not None and self.rows > budget.rows:
+            problems.append(f"{self.rows} rows (budget {budget.rows})")
+        return problems
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def _record_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    stats.statements.append(statement)
+    rowcount = cursor.rowcount
+    if cursor.description is not None and rowcount < 0:
+        # aiosqlite reports no rowcount for SELECTs; the async adapters prefetch
+        # result rows into _rows during execute, so count those instead.
+        rowcount = len(getattr(cursor, "_rows", ()))
+    if rowcount > 0:
+        stats.rows += rowcount
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    if not event.contains(engine.sync_engine, "after_cursor_execute", _record_statement):
+        event.listen(engine.sync_engine, "after_cursor_execute", _record_statement)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def query_budget(statements: int, rows: Optional[int] = None) -> Callable:
+    """Declare the SQL budget of a route; place it below the router decorator."""
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.query_budget = QueryBudget(statements=statements, rows=rows)
+        return endpoint
+    return decorator
+
+
+class QueryBudgetMiddleware:
+    """Checks each request against the budget declared on its endpoint.
+
+    In strict mode (tests) an overrun or a router endpoint without a budget
+    raises QueryBudgetExceeded; otherwise the overrun is logged. The check
+    runs after the response has been sent, so a strict failure only surfaces
+    through TestClient's raise_server_exceptions, never in the HTTP response.
+
+    The endpoint is read from scope["endpoint"], which Starlette's router
+    writes into the shared scope; tests/test_query_budget.py guards that.
+    Overruns are reported by endpoint name, since the route path kept in
+    the scope lacks the include_router prefix.
+    """
+
+    def __init__(self, app, strict: bool = False) -> None:
+        self.app = app
+        self.strict = strict
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            await self.app(scope, receive, send)
+
+        # The router stores the matched endpoint in the shared scope.
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return
+        route = f"{scope['method']} {scope['path']} ({endpoint.__module__}.{endpoint.__name__})"
+        budget = getattr(endpoint, "query_budget", None)
+        if budget is None:
+            if self.strict and endpoint.__module__.startswith("app.routers."):
+                raise QueryBudgetExceeded(f"{route}: no query budget declared on {endpoint.__name__}")
+            return
+
+        problems = stats.violations(budget)
+        if not problems:
+            return
+        message = f"{route} exceeded its query budget: {', '.join(problems)}"
+        if self.strict:
+            raise QueryBudgetExceeded(message + "\n" + "\n".join(stats.statements))
+        logger.warning(message)
@@ -1,12 +1,14 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
-from sqlalchemy import func, and_, or_, not_
-from typing import List, Optional
-from datetime import date
+from sqlalchemy import func, and_, or_, not_, delete
+from typing import List, Optional, Tuple
+from datetime import date, datetime, timedelta, timezone
+import secrets
 
 from . import models, schemas
 from .core.security import get_password_hash
+from .core.config import settings
 
 
 async def get_admin_user_by_username(db: AsyncSession, username: str) -> Optional[models.AdminUser]:
@@ -30,6 +32,10 @@ async def get_room(db: AsyncSession, room_id: int) -> Optional[models.Room]:
     )
     return result.scalars().first()
 
+async def room_exists(db: AsyncSession, room_id: int) -> bool:
+    result = await db.execute(select(models.Room.id).filter(models.Room.id == room_id))
+    return result.scalar() is not None
+
 async def get_rooms(db: AsyncSession, filters: schemas.RoomFilterParams, skip: int = 0, limit: int = 100) -> List[models.Room]:
     query = select(models.Room).options(selectinload(models.Room.images)) 
     if filters.price_min is not None:
@@ -48,7 +54,17 @@ async def get_rooms(db: AsyncSession, filters: schemas.RoomFilterParams, skip: i
                 models.Booking.check_out_date > filters.check_in_date
             )\
             .distinct()
-        query = query.filter(models.Room.id.notin_(subquery_booked_ids))
+        subquery_held_ids = select(models.BookingHold.room_id)\
+            .filter(
+                models.BookingHold.check_in_date < filters.check_out_date,
+                models.BookingHold.check_out_date > filters.check_in_date,
+                models.BookingHold.expires_at > datetime.now(timezone.utc)
+            )\
+            .distinct()
+        query = query.filter(
+            models.Room.id.notin_(subquery_booked_ids),
+            models.Room.id.notin_(subquery_held_ids)
+        )
 
     query = query.offset(skip).limit(limit).order_by(models.Room.id) 
     result = await db.execute(query)
@@ -69,7 +85,7 @@ async def create_booking(db: AsyncSession, booking: schemas.BookingCreate, room:
     total_price = room.price_per_night * num_nights
 
     db_booking = models.Booking(
-        **booking.model_dump(), 
+        **booking.model_dump(exclude={"hold_token"}), 
         total_price=total_price
     )
     db.add(db_booking)
@@ -77,6 +93,23 @@ async def create_booking(db: AsyncSession, booking: schemas.BookingCreate, room:
     await db.refresh(db_booking)
     return db_booking
 
+async def create_booking_from_hold(db: AsyncSession, booking: schemas.BookingCreate, room: models.Room) -> Optional[models.Booking]:
+    # The hold already reserved these dates, so consuming it replaces the overlap scan.
+    # Returns None if the hold expired or was released in the meantime.
+    result = await db.execute(
+        delete(models.BookingHold).where(
+            models.BookingHold.token == booking.hold_token,
+            models.BookingHold.room_id == booking.room_id,
+            models.BookingHold.check_in_date == booking.check_in_date,
+            models.BookingHold.check_out_date == booking.check_out_date,
+            models.BookingHold.expires_at > datetime.now(timezone.utc)
+        )
+    )
+    if result.rowcount != 1:
+        await db.rollback()
+        return None
+    return await create_booking(db=db, booking=booking, room=room)
+
 async def get_all_bookings(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[models.Booking]:
     query = select(models.Booking).offset(skip).limit(limit).order_by(models.Booking.booking_date.desc())
     result = await db.execute(query)
@@ -98,5 +131,76 @@ async def get_booked_dates_for_room(db: AsyncSession, room_id: int) -> List[mode
     query = select(models.Booking.check_in_date, models.Booking.check_out_date)\
             .filter(models.Booking.room_id == room_id)\
             .filter(models.Booking.check_out_date >= today) 
-    result = await db.execute(query)    
-    return result.mappings().all() 
\ No newline at end of file
+    held_query = select(models.BookingHold.check_in_date, models.BookingHold.check_out_date)\
+            .filter(models.BookingHold.room_id == room_id)\
+            .filter(models.BookingHold.expires_at > datetime.now(timezone.utc))
+    result = await db.execute(query.union_all(held_query))    
+    return result.mappings().all() 
+
+
+async def get_room_for_update(db: AsyncSession, room_id: int) -> Optional[models.Room]:
+    result = await db.execute(
+        select(models.Room)
+        .filter(models.Room.id == room_id)
+        .with_for_update()
+    )
+    return result.scalars().first()
+
+async def get_active_holds_for_room_and_dates(db: AsyncSession, room_id: int, check_in: date, check_out: date) -> List[models.BookingHold]:
+    query = select(models.BookingHold).filter(
+        models.BookingHold.room_id == room_id,
+        models.BookingHold.check_in_date < check_out,
+        models.BookingHold.check_out_date > check_in,
+        models.BookingHold.expires_at > datetime.now(timezone.utc)
+    )
+    result = await db.execute(query)
+    return result.scalars().all()
+
+async def get_active_holds(db: AsyncSession) -> List[models.BookingHold]:
+    query = select(models.BookingHold).filter(models.BookingHold.expires_at > datetime.now(timezone.utc))
+    result = await db.execute(query)
+    return result.scalars().all()
+
+async def get_active_hold(db: AsyncSession, token: str) -> Optional[models.BookingHold]:
+    result = await db.execute(
+        select(models.BookingHold).filter(
+            models.BookingHold.token == token,
+            models.BookingHold.expires_at > datetime.now(timezone.utc)
+        )
+    )
+    return result.scalars().first()
+
+async def count_active_holds(db: AsyncSession, room_id: int, client_host: Optional[str]) -> Tuple[int, int]:
+    # Both counts in one statement: (holds by this client, holds on this room).
+    result = await db.execute(
+        select(
+            func.count().filter(models.BookingHold.client_host == client_host),
+            func.count().filter(models.BookingHold.room_id == room_id)
+        ).filter(models.BookingHold.expires_at > datetime.now(timezone.utc))
+    )
+    client_count, room_count = result.one()
+    return client_count, room_count
+
+async def create_booking_hold(db: AsyncSession, hold: schemas.BookingHoldCreate, client_host: Optional[str] = None) -> models.BookingHold:
+    db_hold = models.BookingHold(
+        **hold.model_dump(),
+        client_host=client_host,
+        token=secrets.token_urlsafe(32),
+        expires_at=datetime.now(timezone.utc) + timedelta(minutes=settings.BOOKING_HOLD_EXPIRE_MINUTES)
+    )
+    db.add(db_hold)
+    await db.commit()
+    await db.refresh(db_hold)
+    return db_hold
+
+async def delete_booking_hold(db: AsyncSession, token: str) -> bool:
+    result = await db.execute(delete(models.BookingHold).where(models.BookingHold.token == token))
+    await db.commit()
+    return result.rowcount > 0
+
+async def delete_expired_holds(db: AsyncSession) -> int:
+    result = await db.execute(
+        delete(models.BookingHold).where(models.BookingHold.expires_at <= datetime.now(timezone.utc))
+    )
+    await db.commit()
+    return result.rowcount
\ No newline at end of file
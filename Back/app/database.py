@@ -1,9 +1,11 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config import settings
+from app.core.query_budget import instrument_engine
 
 
 engine = create_async_engine(settings.DATABASE_URL, echo=True) 
+instrument_engine(engine)
 
 AsyncSessionLocal = sessionmaker(
     bind=engine,
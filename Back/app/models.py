@@ -25,6 +25,7 @@ class Room(Base):
 
     images = relationship("RoomImage", back_populates="room", cascade="all, delete-orphan")
     bookings = relationship("Booking", back_populates="room")
+    holds = relationship("BookingHold", back_populates="room", cascade="all, delete-orphan")
 
     __table_args__ = (
         CheckConstraint('price_per_night > 0', name='chk_room_price'),
@@ -67,4 +68,25 @@ class Booking(Base):
         CheckConstraint('num_adults + num_children > 0', name='chk_booking_guests_total'),
         Index('idx_bookings_room_id_dates', 'room_id', 'check_in_date', 'check_out_date'),
         Index('idx_bookings_dates', 'check_in_date', 'check_out_date'),
+    )
+
+
+class BookingHold(Base):
+    __tablename__ = "booking_holds"
+    id = Column(Integer, primary_key=True, index=True)
+    room_id = Column(Integer, ForeignKey("rooms.id", ondelete="CASCADE"), nullable=False)
+    check_in_date = Column(Date, nullable=False)
+    check_out_date = Column(Date, nullable=False)
+    token = Column(String(64), unique=True, nullable=False, index=True)
+    client_host = Column(String(45))
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    room = relationship("Room", back_populates="holds")
+
+    __table_args__ = (
+        CheckConstraint('check_out_date > check_in_date', name='chk_hold_dates'),
+        Index('idx_booking_holds_room_id_dates', 'room_id', 'check_in_date', 'check_out_date'),
+        Index('idx_booking_holds_expires_at', 'expires_at'),
+        Index('idx_booking_holds_client_host', 'client_host'),
     )
\ No newline at end of file
@@ -1,17 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from app import crud, schemas, models
 from app.database import get_db
+from app.core.query_budget import query_budget
 from app.dependencies import get_current_admin_user
 
 router = APIRouter()
 
 @router.get("/bookings", response_model=List[schemas.Booking], tags=["Admin Panel"])
+@query_budget(statements=2, rows=101)
 async def admin_read_all_bookings(
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
     current_user: models.AdminUser = Depends(get_current_admin_user)
 ):
@@ -19,6 +21,7 @@ async def admin_read_all_bookings(
     return bookings
 
 @router.get("/me", response_model=schemas.AdminUser, tags=["Admin Panel"])
+@query_budget(statements=1, rows=1)
 async def read_admin_me(
     current_user: models.AdminUser = Depends(get_current_admin_user)
 ):
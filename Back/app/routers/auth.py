@@ -4,11 +4,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud, schemas
 from app.core import security
+from app.core.query_budget import query_budget
 from app.database import get_db
 
 router = APIRouter()
 
 @router.post("/token", response_model=schemas.Token, tags=["Authentication"])
+@query_budget(statements=1, rows=1)
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: AsyncSession = Depends(get_db)
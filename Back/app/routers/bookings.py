@@ -3,16 +3,20 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from app import crud, schemas, models
+from app.core.holds import hold_store
+from app.core.query_budget import query_budget
 from app.database import get_db
 
 router = APIRouter()
 
 @router.post("/", response_model=schemas.Booking, status_code=status.HTTP_201_CREATED, tags=["Bookings"])
+@query_budget(statements=5)
 async def create_booking(
     booking: schemas.BookingCreate,
     db: AsyncSession = Depends(get_db)
 ):
-    room = await crud.get_room(db, room_id=booking.room_id)
+    # Locking the room row serializes bookings and holds for the same room.
+    room = await crud.get_room_for_update(db, room_id=booking.room_id)
     if not room:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Room not found")
 
@@ -23,21 +27,36 @@ async def create_booking(
             detail=f"Number of guests ({total_guests}) exceeds room capacity ({room.capacity}). Consider booking an additional room or choosing a larger one."
         )
 
-    existing_bookings = await crud.get_bookings_for_room_and_dates(
-        db,
-        room_id=booking.room_id,
-        check_in=booking.check_in_date,
-        check_out=booking.check_out_date
-    )
-    if existing_bookings:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="The room is not available for the selected dates."
+    if not booking.hold_token:
+        if hold_store.overlaps(booking.room_id, booking.check_in_date, booking.check_out_date):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="The room is not available for the selected dates."
+            )
+
+        existing_bookings = await crud.get_bookings_for_room_and_dates(
+            db,
+            room_id=booking.room_id,
+            check_in=booking.check_in_date,
+            check_out=booking.check_out_date
+        )
+        existing_holds = await crud.get_active_holds_for_room_and_dates(
+            db,
+            room_id=booking.room_id,
+            check_in=booking.check_in_date,
+            check_out=booking.check_out_date
         )
+        if existing_bookings or existing_holds:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="The room is not available for the selected dates."
+            )
 
     try:
-        created_booking = await crud.create_booking(db=db, booking=booking, room=room)
-        return created_booking
+        if booking.hold_token:
+            created_booking = await crud.create_booking_from_hold(db=db, booking=booking, room=room)
+        else:
+            created_booking = await crud.create_booking(db=db, booking=booking, room=room)
     except Exception as e:
         await db.rollback() 
         print(f"Error creating booking: {e}") 
@@ -46,7 +65,17 @@ async def create_booking(
             detail="Could not create booking due to an internal error."
         )
 
+    if created_booking is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="The hold has expired or does not match the selected room and dates."
+        )
+    if booking.hold_token:
+        hold_store.discard(booking.hold_token)
+    return created_booking
+
 @router.get("/{booking_id}", response_model=schemas.Booking, tags=["Bookings"])
+@query_budget(statements=1, rows=1)
 async def read_booking(booking_id: int, db: AsyncSession = Depends(get_db)):
     db_booking = await crud.get_booking(db, booking_id=booking_id)
     if db_booking is None:
@@ -0,0 +1,71 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, schemas
+from app.core.config import settings
+from app.core.holds import HeldRange, hold_store
+from app.core.query_budget import query_budget
+from app.database import get_db
+
+router = APIRouter()
+
+@router.post("/", response_model=schemas.BookingHold, status_code=status.HTTP_201_CREATED, tags=["Bookings"])
+@query_budget(statements=6)
+async def create_booking_hold(
+    hold: schemas.BookingHoldCreate,
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+):
+    if hold_store.overlaps(hold.room_id, hold.check_in_date, hold.check_out_date):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="The room is not available for the selected dates."
+        )
+
+    # Locking the room row serializes bookings and holds for the same room.
+    room = await crud.get_room_for_update(db, room_id=hold.room_id)
+    if not room:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Room not found")
+
+    # Caps keep a single client from hiding the whole inventory behind holds.
+    client_host = request.client.host if request.client else None
+    client_count, room_count = await crud.count_active_holds(db, room_id=hold.room_id, client_host=client_host)
+    if client_count >= settings.BOOKING_HOLD_MAX_PER_CLIENT:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many active holds. Complete or release an existing hold first."
+        )
+    if room_count >= settings.BOOKING_HOLD_MAX_PER_ROOM:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="The room has too many pending holds. Please try again later."
+        )
+
+    existing_bookings = await crud.get_bookings_for_room_and_dates(
+        db,
+        room_id=hold.room_id,
+        check_in=hold.check_in_date,
+        check_out=hold.check_out_date
+    )
+    existing_holds = await crud.get_active_holds_for_room_and_dates(
+        db,
+        room_id=hold.room_id,
+        check_in=hold.check_in_date,
+        check_out=hold.check_out_date
+    )
+    if existing_bookings or existing_holds:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="The room is not available for the selected dates."
+        )
+
+    db_hold = await crud.create_booking_hold(db=db, hold=hold, client_host=client_host)
+    hold_store.add(HeldRange.from_hold(db_hold))
+    return db_hold
+
+@router.delete("/{token}", status_code=status.HTTP_204_NO_CONTENT, tags=["Bookings"])
+@query_budget(statements=1, rows=1)
+async def release_booking_hold(token: str, db: AsyncSession = Depends(get_db)):
+    hold_store.discard(token)
+    if not await crud.delete_booking_hold(db, token=token):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Hold not found")
@@ -1,18 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 from typing import List, Optional
 from datetime import date
 
 from app import crud, schemas, models
 from app.database import get_db
+from app.core.query_budget import query_budget
 from app.dependencies import get_current_admin_user 
 
 router = APIRouter()
 
+# limit caps the page at 100 rooms; the rest of the row budget covers their images.
 @router.get("/", response_model=List[schemas.Room], tags=["Rooms"])
+@query_budget(statements=2, rows=500)
 async def read_rooms(
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=100),
     price_min: Optional[float] = Query(None, ge=0, description="Минимальная цена за ночь"),
     price_max: Optional[float] = Query(None, description="Максимальная цена за ночь"),
     capacity_min: Optional[int] = Query(None, ge=1, description="Минимальная вместимость"),
@@ -40,6 +44,7 @@ async def read_rooms(
 
 
 @router.get("/{room_id}", response_model=schemas.Room, tags=["Rooms"])
+@query_budget(statements=2)
 async def read_room(room_id: int, db: AsyncSession = Depends(get_db)):
     db_room = await crud.get_room(db=db, room_id=room_id)
     if db_room is None:
@@ -49,6 +54,7 @@ async def read_room(room_id: int, db: AsyncSession = Depends(get_db)):
 
 
 @router.post("/", response_model=schemas.Room, status_code=status.HTTP_201_CREATED, tags=["Rooms", "Admin"])
+@query_budget(statements=3, rows=3)
 async def create_room(
     room: schemas.RoomCreate,
     db: AsyncSession = Depends(get_db),
@@ -59,26 +65,27 @@ async def create_room(
     await db.commit()
     await db.refresh(db_room)
     
-    db_room.images = [] 
+    # A new room has no images; plain assignment would lazy-load the collection.
+    set_committed_value(db_room, "images", [])
     return db_room
 
 @router.post("/{room_id}/images", response_model=schemas.RoomImage, status_code=status.HTTP_201_CREATED, tags=["Rooms", "Admin"])
+@query_budget(statements=4, rows=4)
 async def add_image_to_room(
     room_id: int,
     image: schemas.RoomImageCreate,
     db: AsyncSession = Depends(get_db),
     current_user: models.AdminUser = Depends(get_current_admin_user)
 ):
-    db_room = await crud.get_room(db=db, room_id=room_id)
-    if db_room is None:
+    if not await crud.room_exists(db=db, room_id=room_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Room not found")
     db_image = await crud.add_room_image(db=db, room_id=room_id, image_data=image)
     return db_image
 
 @router.get("/{room_id}/booked-dates", response_model=List[schemas.BookedDateRange], tags=["Rooms", "Bookings"])
+@query_budget(statements=2)
 async def read_room_booked_dates(room_id: int, db: AsyncSession = Depends(get_db)):  
-    db_room = await crud.get_room(db=db, room_id=room_id)
-    if db_room is None:
+    if not await crud.room_exists(db=db, room_id=room_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Room not found")
 
     booked_dates_data = await crud.get_booked_dates_for_room(db, room_id=room_id)
@@ -27,6 +27,20 @@ class BookingBase(BaseModel):
             )
         return self
 
+class BookingHoldBase(BaseModel):
+    room_id: int
+    check_in_date: date
+    check_out_date: date
+
+    @model_validator(mode='after')
+    def check_dates(self) -> 'BookingHoldBase':
+        if self.check_in_date >= self.check_out_date:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Check-out date must be after check-in date"
+            )
+        return self
+
 class RoomBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=150)
     description: Optional[str] = None
@@ -40,7 +54,17 @@ class RoomImageCreate(RoomImageBase):
     pass
 
 class BookingCreate(BookingBase):
-    pass 
+    hold_token: Optional[str] = Field(None, max_length=64)
+
+class BookingHoldCreate(BookingHoldBase):
+    @model_validator(mode='after')
+    def check_not_past(self) -> 'BookingHoldCreate':
+        if self.check_in_date < date.today():
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Check-in date cannot be in the past"
+            )
+        return self
 
 class RoomCreate(RoomBase):
     pass
@@ -61,6 +85,13 @@ class Booking(BookingBase):
     class Config:
         from_attributes = True
 
+class BookingHold(BookingHoldBase):
+    token: str
+    expires_at: datetime
+
+    class Config:
+        from_attributes = True
+
 class Room(RoomBase):
     id: int
     created_at: datetime
@@ -1,12 +1,51 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 
-from app.routers import auth, rooms, bookings, admin
-from app.database import Base, engine 
+from app import crud
+from app.routers import auth, rooms, bookings, admin, holds
+from app.database import Base, engine, AsyncSessionLocal
 from app.core.config import settings
+from app.core.holds import HeldRange, hold_store
+from app.core.query_budget import QueryBudgetMiddleware
+
+
+logger = logging.getLogger(__name__)
+
+
+async def sync_hold_store():
+    async with AsyncSessionLocal() as db:
+        await crud.delete_expired_holds(db)
+        holds = await crud.get_active_holds(db)
+    hold_store.replace(HeldRange.from_hold(hold) for hold in holds)
+
+async def reap_expired_holds():
+    while True:
+        await asyncio.sleep(settings.BOOKING_HOLD_REAP_INTERVAL_SECONDS)
+        try:
+            await sync_hold_store()
+        except Exception:
+            logger.exception("Could not sync booking holds")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        await sync_hold_store()
+    except Exception:
+        # Databases created before booking holds need the booking_holds table from sql_db.sql.
+        logger.exception("Could not load booking holds; has sql_db.sql been applied?")
+    reaper = asyncio.create_task(reap_expired_holds())
+    yield
+    reaper.cancel()
+    with suppress(asyncio.CancelledError):
+        await reaper
+    hold_store.clear()
 
 app = FastAPI(
     title="Booking API",
@@ -14,7 +53,8 @@ app = FastAPI(
     version="1.0.0",
     openapi_url="/api/v1/openapi.json", 
     docs_url="/api/v1/docs",           
-    redoc_url="/api/v1/redoc"          
+    redoc_url="/api/v1/redoc",
+    lifespan=lifespan
 )
 
 origins = [
@@ -34,6 +74,8 @@ app.add_middleware(
     allow_headers=["*"],          
 )
 
+app.add_middleware(QueryBudgetMiddleware, strict=settings.QUERY_BUDGET_STRICT)
+
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -53,6 +95,7 @@ api_prefix = "/api/v1"
 app.include_router(auth.router, prefix=f"{api_prefix}/auth")
 app.include_router(rooms.router, prefix=f"{api_prefix}/rooms")
 app.include_router(bookings.router, prefix=f"{api_prefix}/bookings")
+app.include_router(holds.router, prefix=f"{api_prefix}/holds")
 app.include_router(admin.router, prefix=f"{api_prefix}/admin")
 
 @app.get("/", tags=["Root"])
@@ -0,0 +1,79 @@
+import asyncio
+import os
+import tempfile
+from datetime import date, timedelta
+
+import pytest
+
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_dir}/test.db"
+os.environ["SECRET_KEY"] = "test-secret-key"
+os.environ["QUERY_BUDGET_STRICT"] = "true"
+
+from fastapi.testclient import TestClient
+
+from app import models
+from app.core import security
+from app.core.holds import hold_store
+from app.database import AsyncSessionLocal, Base, engine
+from main import app
+
+
+async def _reset_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def _add(*objects):
+    async with AsyncSessionLocal() as db:
+        db.add_all(objects)
+        await db.commit()
+        return [obj.id for obj in objects]
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    asyncio.run(_reset_tables())
+    asyncio.run(engine.dispose())
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def client(app_client):
+    app_client.portal.call(_reset_tables)
+    hold_store.clear()
+    return app_client
+
+
+@pytest.fixture
+def add(client):
+    """Insert ORM objects directly, outside any request, and return their ids."""
+    def add(*objects):
+        return client.portal.call(_add, *objects)
+    return add
+
+
+@pytest.fixture
+def room_id(add):
+    room_id, _ = add(
+        models.Room(name="Double", price_per_night=100, capacity=2, bed_type="double"),
+        models.AdminUser(username="admin", hashed_password="unused"),
+    )
+    return room_id
+
+
+@pytest.fixture
+def admin_headers(room_id):
+    token = security.create_access_token(data={"sub": "admin"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def stay():
+    check_in = date.today() + timedelta(days=10)
+    return {
+        "check_in_date": check_in.isoformat(),
+        "check_out_date": (check_in + timedelta(days=3)).isoformat(),
+    }
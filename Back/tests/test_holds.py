@@ -0,0 +1,86 @@
+from datetime import date, datetime, timedelta, timezone
+
+from app import crud, models
+from app.core.holds import hold_store
+from app.database import AsyncSessionLocal
+from main import sync_hold_store
+
+API = "/api/v1"
+
+
+def _stay(days_ahead, nights=2):
+    check_in = date.today() + timedelta(days=days_ahead)
+    return {
+        "check_in_date": check_in.isoformat(),
+        "check_out_date": (check_in + timedelta(days=nights)).isoformat(),
+    }
+
+
+def test_hold_blocks_search_and_direct_booking(client, room_id, stay):
+    assert client.post(f"{API}/holds/", json={"room_id": room_id, **stay}).status_code == 201
+
+    assert client.get(f"{API}/rooms/", params=stay).json() == []
+    response = client.post(
+        f"{API}/bookings/",
+        json={"room_id": room_id, "guest_name": "Bob", "num_adults": 1, **stay},
+    )
+    assert response.status_code == 409
+
+
+def test_hold_token_must_match_booking(client, room_id, stay):
+    token = client.post(f"{API}/holds/", json={"room_id": room_id, **stay}).json()["token"]
+    response = client.post(
+        f"{API}/bookings/",
+        json={"room_id": room_id, "guest_name": "Ann", "num_adults": 1, "hold_token": token, **_stay(30)},
+    )
+    assert response.status_code == 409
+
+
+def test_hold_in_the_past_is_rejected(client, room_id):
+    response = client.post(f"{API}/holds/", json={"room_id": room_id, **_stay(-1)})
+    assert response.status_code == 409
+
+
+def test_active_holds_are_capped_per_client(client, room_id, add):
+    other_room_id, = add(models.Room(name="Single", price_per_night=60, capacity=1))
+    assert client.post(f"{API}/holds/", json={"room_id": room_id, **_stay(10)}).status_code == 201
+    assert client.post(f"{API}/holds/", json={"room_id": other_room_id, **_stay(10)}).status_code == 201
+
+    response = client.post(f"{API}/holds/", json={"room_id": room_id, **_stay(20)})
+    assert response.status_code == 429
+
+
+def test_active_holds_are_capped_per_room(client, room_id, add):
+    add(*[
+        models.BookingHold(
+            room_id=room_id,
+            token=f"other-{days}",
+            client_host=f"10.0.0.{days}",
+            expires_at=datetime.now(timezone.utc) + timedelta(minutes=5),
+            **{key: date.fromisoformat(value) for key, value in _stay(days).items()},
+        )
+        for days in (10, 20, 30)
+    ])
+    response = client.post(f"{API}/holds/", json={"room_id": room_id, **_stay(40)})
+    assert response.status_code == 409
+
+
+def test_sync_drops_holds_released_elsewhere(client, room_id, stay):
+    token = client.post(f"{API}/holds/", json={"room_id": room_id, **stay}).json()["token"]
+    assert len(hold_store) == 1
+
+    # Released behind this process's back: only the database knows.
+    client.portal.call(_delete_hold, token)
+    client.portal.call(sync_hold_store)
+
+    assert len(hold_store) == 0
+    response = client.post(
+        f"{API}/bookings/",
+        json={"room_id": room_id, "guest_name": "Bob", "num_adults": 1, **stay},
+    )
+    assert response.status_code == 201
+
+
+async def _delete_hold(token):
+    async with AsyncSessionLocal() as db:
+        await crud.delete_booking_hold(db, token=token)
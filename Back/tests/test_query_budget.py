@@ -0,0 +1,117 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from app.core.query_budget import QueryBudget, QueryBudgetExceeded, QueryBudgetMiddleware
+from app.routers import bookings
+from main import app
+
+API = "/api/v1"
+
+
+def test_every_router_endpoint_declares_a_budget():
+    missing = [
+        route.path for route in app.routes
+        if isinstance(route, APIRoute)
+        and route.endpoint.__module__.startswith("app.routers.")
+        and getattr(route.endpoint, "query_budget", None) is None
+    ]
+    assert missing == []
+
+
+# The strict middleware raises QueryBudgetExceeded from any of these calls
+# if a route runs more statements or rows than it declares.
+
+def test_room_routes_within_budget(client, room_id, admin_headers, stay):
+    assert client.get(f"{API}/rooms/").status_code == 200
+    assert client.get(f"{API}/rooms/", params=stay).status_code == 200
+    assert client.get(f"{API}/rooms/{room_id}").status_code == 200
+    assert client.get(f"{API}/rooms/{room_id}/booked-dates").status_code == 200
+    assert client.get(f"{API}/rooms/999/booked-dates").status_code == 404
+
+    response = client.post(
+        f"{API}/rooms/",
+        json={"name": "Suite", "price_per_night": 250, "capacity": 4},
+        headers=admin_headers,
+    )
+    assert response.status_code == 201
+    response = client.post(
+        f"{API}/rooms/{room_id}/images",
+        json={"image_url": "/img/1.jpg"},
+        headers=admin_headers,
+    )
+    assert response.status_code == 201
+
+
+def test_booking_routes_within_budget(client, room_id, admin_headers, stay):
+    response = client.post(
+        f"{API}/bookings/",
+        json={"room_id": room_id, "guest_name": "Ann", "num_adults": 2, **stay},
+    )
+    assert response.status_code == 201
+    assert client.get(f"{API}/bookings/{response.json()['id']}").status_code == 200
+    assert client.get(f"{API}/admin/bookings", headers=admin_headers).status_code == 200
+    assert client.get(f"{API}/admin/me", headers=admin_headers).status_code == 200
+    response = client.post(f"{API}/auth/token", data={"username": "nobody", "password": "x"})
+    assert response.status_code == 401
+
+
+def test_hold_routes_within_budget(client, room_id, stay):
+    response = client.post(f"{API}/holds/", json={"room_id": room_id, **stay})
+    assert response.status_code == 201
+    assert client.delete(f"{API}/holds/{response.json()['token']}").status_code == 204
+
+    token = client.post(f"{API}/holds/", json={"room_id": room_id, **stay}).json()["token"]
+    response = client.post(
+        f"{API}/bookings/",
+        json={"room_id": room_id, "guest_name": "Ann", "num_adults": 1, "hold_token": token, **stay},
+    )
+    assert response.status_code == 201
+
+
+def test_list_rows_are_capped_by_limit(client, room_id):
+    assert client.get(f"{API}/rooms/", params={"limit": 101}).status_code == 422
+
+
+def test_statement_overrun_raises(client, room_id, monkeypatch):
+    monkeypatch.setattr(bookings.read_booking, "query_budget", QueryBudget(statements=0))
+    with pytest.raises(QueryBudgetExceeded, match="1 statements"):
+        client.get(f"{API}/bookings/1")
+
+
+def test_row_overrun_raises(client, room_id, stay, monkeypatch):
+    response = client.post(
+        f"{API}/bookings/",
+        json={"room_id": room_id, "guest_name": "Ann", "num_adults": 1, **stay},
+    )
+    monkeypatch.setattr(bookings.read_booking, "query_budget", QueryBudget(statements=1, rows=0))
+    with pytest.raises(QueryBudgetExceeded, match="1 rows"):
+        client.get(f"{API}/bookings/{response.json()['id']}")
+
+
+def test_endpoint_without_budget_is_rejected(client, monkeypatch):
+    monkeypatch.delattr(bookings.read_booking, "query_budget")
+    with pytest.raises(QueryBudgetExceeded, match="no query budget declared on read_booking"):
+        client.get(f"{API}/bookings/1")
+
+
+def test_middleware_resolves_matched_route(client, monkeypatch, caplog):
+    # Guards the reliance on the router writing "endpoint" into the scope the
+    # middleware holds; without it the overrun would pass silently.
+    lenient_app = FastAPI()
+    lenient_app.include_router(bookings.router, prefix=f"{API}/bookings")
+    lenient_app.add_middleware(QueryBudgetMiddleware, strict=False)
+    monkeypatch.setattr(bookings.read_booking, "query_budget", QueryBudget(statements=0))
+
+    with caplog.at_level(logging.WARNING, logger="app.core.query_budget"):
+        response = TestClient(lenient_app).get(f"{API}/bookings/1")
+
+    assert response.status_code == 404
+    assert (
+        f"GET {API}/bookings/1 (app.routers.bookings.read_booking) exceeded its query budget: "
+        "1 statements (budget 0)"
+    ) in caplog.text
+
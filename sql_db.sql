@@ -1,3 +1,4 @@
+DROP TABLE IF EXISTS booking_holds;
 DROP TABLE IF EXISTS bookings;
 DROP TABLE IF EXISTS room_images;
 DROP TABLE IF EXISTS rooms;
@@ -46,12 +47,27 @@ CREATE TABLE bookings (
     CONSTRAINT chk_guests CHECK (num_adults > 0 OR num_children > 0)
 );
 
+CREATE TABLE booking_holds (
+    id SERIAL PRIMARY KEY,
+    room_id INTEGER NOT NULL REFERENCES rooms(id) ON DELETE CASCADE,
+    check_in_date DATE NOT NULL,
+    check_out_date DATE NOT NULL,
+    token VARCHAR(64) UNIQUE NOT NULL,
+    client_host VARCHAR(45),
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT chk_hold_dates CHECK (check_out_date > check_in_date)
+);
+
 
 
 CREATE INDEX idx_rooms_price ON rooms(price_per_night);
 CREATE INDEX idx_rooms_capacity ON rooms(capacity);
 CREATE INDEX idx_bookings_room_id_dates ON bookings(room_id, check_in_date, check_out_date);
 CREATE INDEX idx_bookings_dates ON bookings(check_in_date, check_out_date);
+CREATE INDEX idx_booking_holds_room_id_dates ON booking_holds(room_id, check_in_date, check_out_date);
+CREATE INDEX idx_booking_holds_expires_at ON booking_holds(expires_at);
+CREATE INDEX idx_booking_holds_client_host ON booking_holds(client_host);
 CREATE INDEX idx_admin_users_username ON admin_users(username);
 
 CREATE OR REPLACE FUNCTION update_modified_column()